@@ -1,10 +1,8 @@
 import streamlit as st
-import pandas as pd
-import altair as alt
 
-from casandra.demo_pipeline import score_reit
+# Only the lightweight config is imported up front so the sidebar renders right away;
+# pandas/altair and the pipeline (requests, lxml, nltk, ...) load on first use.
 from casandra.config import WEIGHTS as DEFAULT_WEIGHTS, SEC_USER_AGENT
-from casandra.price_projection import get_current_price_yf, project_prices_from_scores
 
 st.set_page_config(page_title="CASANDRA", page_icon="🏙️", layout="wide")
 
@@ -13,6 +11,29 @@ st.caption("MVP interface to score REITs using climate, carbon, and governance f
 
 carbon_csv = "carbon_inputs.csv"
 
+# Streamlit reruns the whole script on every widget change: keep pipeline results
+# for a day so moving a weight slider doesn't re-hit SEC, Nominatim and the news feed.
+@st.cache_data(show_spinner=False, ttl=24 * 3600)
+def cached_score_reit(cik: str, name: str, ticker: str, carbon_csv: str) -> dict:
+    from casandra.demo_pipeline import score_reit
+    return score_reit(cik=cik, name=name, ticker=ticker, carbon_csv=carbon_csv)
+
+# Quotes are fine to reuse for a few minutes; saves a Yahoo round trip per rerun.
+@st.cache_data(show_spinner=False, ttl=300)
+def cached_price(ticker: str) -> float:
+    from casandra.price_projection import get_current_price_yf
+    return get_current_price_yf(ticker)
+
+@st.cache_data(show_spinner=False, ttl=300)
+def cached_projections(current_price: float, final_1y: float, final_5y: float, final_10y: float):
+    from casandra.price_projection import project_prices_from_scores
+    return project_prices_from_scores(
+        current_price=current_price,
+        final_esg_1y=final_1y,
+        final_esg_5y=final_5y,
+        final_esg_10y=final_10y,
+    )
+
 # Show instructions only if the scoring button hasn't been pressed yet
 if "scoring_done" not in st.session_state or not st.session_state.scoring_done:
     st.badge(
@@ -44,12 +65,12 @@ with st.sidebar:
 
     run_btn = st.button("▶️ Run scoring")
 
-# Normalize weights to 0..1
+# Normalize weights to 0..1, as a (climate, carbon, gov) tuple
 def normalize_weights(a, b, c):
     s = a + b + c
     if s == 0:
-        return {"climate": 1/3, "carbon": 1/3, "gov": 1/3}
-    return {"climate": a/s, "carbon": b/s, "gov": c/s}
+        return (1/3, 1/3, 1/3)
+    return (a/s, b/s, c/s)
 
 user_weights = normalize_weights(w_climate, w_carbon, w_gov)
 
@@ -57,10 +78,14 @@ col_left, col_right = st.columns([1.1, 1])
 
 
 if run_btn:
+    import pandas as pd
+    import altair as alt
+    from casandra.scoring import combine_scores_vec, format_score
+
     with st.spinner("Scoring REIT… (fetching SEC filing, geocoding, climate, news)"):
         try:
             # Call pipeline
-            res = score_reit(
+            res = cached_score_reit(
                 cik=cik.strip(),
                 name=name.strip(),
                 ticker=ticker.strip(),
@@ -78,13 +103,10 @@ if run_btn:
             gov_5y = res["gov_score_5y"]
             gov_10y = res["gov_score_10y"]
 
-            # Combine with user weights
-            def combine(c, ca, g, w):
-                return round(w["climate"]*c + w["carbon"]*ca + w["gov"]*g, 2)
-
-            final_1y  = combine(climate_score, carbon_score, gov_1y,  user_weights)
-            final_5y  = combine(climate_score, carbon_score, gov_5y,  user_weights)
-            final_10y = combine(climate_score, carbon_score, gov_10y, user_weights)
+            # Combine with user weights (all three horizons in one call)
+            final_1y, final_5y, final_10y = (
+                format_score(x) for x in combine_scores_vec(climate_score, carbon_score, [gov_1y, gov_5y, gov_10y], user_weights)
+            )
 
             # Left: numbers
             with col_left:
@@ -140,13 +162,8 @@ if run_btn:
 
             if ticker and final_1y is not None and final_5y is not None and final_10y is not None:
                 try:
-                    current_price = get_current_price_yf(ticker)
-                    proj = project_prices_from_scores(
-                        current_price=current_price,
-                        final_esg_1y=final_1y,
-                        final_esg_5y=final_5y,
-                        final_esg_10y=final_10y,
-                    )
+                    current_price = cached_price(ticker)
+                    proj = cached_projections(current_price, final_1y, final_5y, final_10y)
 
                     # Current price
                     st.subheader("Current")
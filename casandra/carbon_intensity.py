@@ -11,47 +11,102 @@ MVP: read a CSV you curate with columns:
     ticker, scope12_tonnes_co2e, gross_leasable_area_sqm
 """
 
-import math, pandas as pd
-from typing import Optional, Union
+import csv, math, os, numpy as np
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Optional, Union
+
+if TYPE_CHECKING:
+    import pandas as pd  # only the DataFrame helpers need it; imported there on use
+
+_REQUIRED_COLS = {"ticker", "scope12_tonnes_co2e", "gross_leasable_area_sqm"}
 
 def carbon_intensity_from_csv(csv_path: str, ticker: str) -> Optional[float]:
-    df = pd.read_csv(csv_path)
-    row = df[df["ticker"].str.upper() == ticker.upper()].head(1)
-    if row.empty:
+    # CSV parsed once per file version (mtime), then a dict lookup
+    return _carbon_intensities(csv_path, os.stat(csv_path).st_mtime_ns).get(ticker.upper())
+
+@lru_cache(maxsize=4)
+def _carbon_intensities(csv_path: str, mtime_ns: int) -> Dict[str, Optional[float]]:
+    """{TICKER: kgCO2e/sqm or None} for every row of the CSV; first row wins on duplicates."""
+    with open(csv_path, newline="", encoding="utf-8-sig") as f:  # the sample CSV starts with a BOM
+        reader = csv.DictReader(f)
+        cols = {(c or "").strip().lower(): c for c in reader.fieldnames or []}
+        missing = _REQUIRED_COLS.difference(cols)
+        if missing:
+            raise ValueError(f"carbon_inputs is missing columns: {sorted(missing)}")
+        out: Dict[str, Optional[float]] = {}
+        for row in reader:
+            key = (row[cols["ticker"]] or "").strip().upper()
+            if key and key not in out:
+                out[key] = carbon_intensity_from_row({
+                    "scope12_tonnes_co2e": _to_float(row[cols["scope12_tonnes_co2e"]]),
+                    "gross_leasable_area_sqm": _to_float(row[cols["gross_leasable_area_sqm"]]),
+                })
+    return out
+
+def _to_float(v: Optional[str]) -> Optional[float]:
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return None  # blank / non-numeric cell
+
+def carbon_intensity_from_row(row: dict) -> Optional[float]:
+    """
+    kgCO2e/sqm from a single record with scope12_tonnes_co2e and
+    gross_leasable_area_sqm keys (e.g. one REIT's dynamic carbon row).
+    Plain float math: no need to wrap one row in a DataFrame.
+    """
+    t = row.get("scope12_tonnes_co2e")
+    a = row.get("gross_leasable_area_sqm")
+    if t is None or a is None:
         return None
-    t = float(row.iloc[0]["scope12_tonnes_co2e"])
-    a = float(row.iloc[0]["gross_leasable_area_sqm"])
-    if a <= 0:
+    t, a = float(t), float(a)
+    if math.isnan(t) or math.isnan(a) or a <= 0:
         return None
-    kg_per_sqm = (t * 1000) / a
-    return kg_per_sqm
-
-def _load_carbon_df(carbon: Union[str, "pd.DataFrame"]) -> pd.DataFrame:
-    if isinstance(carbon, pd.DataFrame):
-        df = carbon.copy()
-    else:
-        df = pd.read_csv(carbon)
+    return (t * 1000.0) / a
+
+def _load_carbon_df(carbon: Union[str, "pd.DataFrame"]) -> "pd.DataFrame":
+    if not isinstance(carbon, (str, os.PathLike)):  # a DataFrame
+        return _index_carbon_df(carbon.copy())
+    # keyed on mtime so an edited/uploaded CSV is picked up without a restart
+    return _read_carbon_csv(carbon, os.stat(carbon).st_mtime_ns)
+
+# explicit dtypes skip pandas' per-column type inference
+_CARBON_DTYPES = {"ticker": "string", "scope12_tonnes_co2e": "float64", "gross_leasable_area_sqm": "float64"}
+
+@lru_cache(maxsize=8)
+def _read_carbon_csv(csv_path: str, mtime_ns: int) -> "pd.DataFrame":
+    import pandas as pd
+    return _index_carbon_df(pd.read_csv(csv_path, dtype=_CARBON_DTYPES))
+
+def _index_carbon_df(df: "pd.DataFrame") -> "pd.DataFrame":
     # normalize column names
     df.columns = [c.strip().lower() for c in df.columns]
-    required = {"ticker", "scope12_tonnes_co2e", "gross_leasable_area_sqm"}
-    missing = required.difference(set(df.columns))
+    missing = _REQUIRED_COLS.difference(set(df.columns))
     if missing:
         raise ValueError(f"carbon_inputs is missing columns: {sorted(missing)}")
-    return df
+    # upper-case tickers once and index on them; first row wins on duplicates
+    df["ticker"] = df["ticker"].astype("string").str.upper()
+    return df.drop_duplicates("ticker").set_index("ticker", drop=False)
 
 def carbon_intensity_kg_per_sqm(carbon: Union[str, "pd.DataFrame"], ticker: str) -> Optional[float]:
+    import pandas as pd
     df = _load_carbon_df(carbon)
-    # robust ticker match
-    row = df[df["ticker"].astype(str).str.upper() == ticker.upper()].head(1)
-    if row.empty:
+    key = ticker.upper()
+    try:
+        t = df.at[key, "scope12_tonnes_co2e"]
+        gla = df.at[key, "gross_leasable_area_sqm"]
+    except KeyError:
         return None
-    t = row["scope12_tonnes_co2e"].iloc[0]
-    gla = row["gross_leasable_area_sqm"].iloc[0]
     if pd.isna(t) or pd.isna(gla) or gla == 0:
         return None
     kg = float(t) * 1000.0
     return kg / float(gla)
 
+# Intensity breakpoints (kgCO2e/sqm) and the score for each band:
+# <3 -> 10, <8 -> 35, <15 -> 60, <25 -> 80, else 95
+_BKPTS = np.array([3.0, 8.0, 15.0, 25.0])
+_SCORES = np.array([10.0, 35.0, 60.0, 80.0, 95.0])
+
 def carbon_score_0_100(kg_per_sqm: Optional[float]) -> float:
     """
     Map intensity to 0–100 (higher = worse).
@@ -59,8 +114,12 @@ def carbon_score_0_100(kg_per_sqm: Optional[float]) -> float:
     """
     if kg_per_sqm is None:
         return 50.0  # unknown -> neutral
-    if kg_per_sqm < 3:   return 10.0
-    if kg_per_sqm < 8:   return 35.0
-    if kg_per_sqm < 15:  return 60.0
-    if kg_per_sqm < 25:  return 80.0
-    return 95.0
+    return float(_SCORES[np.searchsorted(_BKPTS, kg_per_sqm, side="right")])
+
+def carbon_score_vec(kg_per_sqm: np.ndarray) -> np.ndarray:
+    """
+    Vectorized carbon_score_0_100 for a column of intensities; NaN -> neutral 50.
+    """
+    arr = np.asarray(kg_per_sqm, dtype=float)
+    scores = _SCORES[np.searchsorted(_BKPTS, np.nan_to_num(arr, nan=0.0), side="right")]
+    return np.where(np.isnan(arr), 50.0, scores)
@@ -13,13 +13,36 @@ All scores are mapped to 0–100 (higher = WORSE risk).
 """
 
 import math, requests
-from typing import Dict
-from .config import REQUEST_TIMEOUT
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Tuple
+from .config import REQUEST_TIMEOUT, CLIMATE_CACHE_TTL
+from .disk_cache import DiskCache, MISSING, remember
+from .http_utils import make_session
 
 OPEN_METEO = "https://climate-api.open-meteo.com/v1/climate"
 OPEN_ELEV = "https://api.open-elevation.com/api/v1/lookup"
+ELEV_BATCH = 100  # points per Open-Elevation POST
+CLIMATE_GRID = 20  # cells per degree: climate scores are memoized per 0.05° (~5 km) cell
+
+# shared by every property lookup (and the worker threads), so connections are reused
+_SESSION = make_session()
 
 def heat_risk_score(lat: float, lon: float) -> float:
+    # round to ~100 m so properties on the same block share one lookup
+    try:
+        mx = _july_max_temp(round(lat, 3), round(lon, 3))
+    except requests.HTTPError:
+        return 50.0
+    return _heat_from_temp(mx)
+
+def _heat_from_temp(mx: float) -> float:
+    # map 30–50°C -> 20–100 risk
+    return max(0, min(100, (mx - 30) * 4 + 20))
+
+@lru_cache(maxsize=4096)
+def _july_max_temp(lat: float, lon: float) -> float:
     params = {
         "latitude": lat,
         "longitude": lon,
@@ -28,17 +51,18 @@ def heat_risk_score(lat: float, lon: float) -> float:
         "models": "MPI-ESM1-2-LR",
         "daily": "temperature_2m_max",
     }
-    r = requests.get(OPEN_METEO, params=params, timeout=REQUEST_TIMEOUT)
+    r = _SESSION.get(OPEN_METEO, params=params, timeout=REQUEST_TIMEOUT)
     if r.status_code != 200:
-        return 50.0
+        # raised (not returned) so lru_cache does not keep the failure
+        raise requests.HTTPError(f"Open-Meteo returned {r.status_code}", response=r)
     js = r.json()
     # crude delta vs. 1991-2020 baseline if available; else map absolute max to risk
-    mx = max(js.get("daily", {}).get("temperature_2m_max", [30]))
-    # map 30–50°C -> 20–100 risk
-    return max(0, min(100, (mx - 30) * 4 + 20))
+    # (~30 years x 31 July days; model gaps come back as null -> NaN)
+    temps = np.asarray(js.get("daily", {}).get("temperature_2m_max") or [30.0], dtype=float)
+    return 30.0 if np.isnan(temps).all() else float(np.nanmax(temps))
 
 def elevation_meters(lat: float, lon: float) -> float:
-    r = requests.get(OPEN_ELEV, params={"locations": f"{lat},{lon}"}, timeout=REQUEST_TIMEOUT)
+    r = _SESSION.get(OPEN_ELEV, params={"locations": f"{lat},{lon}"}, timeout=REQUEST_TIMEOUT)
     if r.status_code != 200:
         return 50.0
     js = r.json()
@@ -46,6 +70,45 @@ def elevation_meters(lat: float, lon: float) -> float:
         return float(js["results"][0]["elevation"])
     return 50.0
 
+def elevations_batch(coords: List[Tuple[float, float]]) -> np.ndarray:
+    """
+    Elevations for many points with one POST per ELEV_BATCH points instead of
+    one GET each. Same fallbacks as elevation_meters (50 m on a bad status or a
+    missing result); NaN for points whose request could not be made or whose
+    response could not be read.
+    """
+    return _elevations(coords)[0]
+
+def _elevations(coords: List[Tuple[float, float]]) -> Tuple[np.ndarray, np.ndarray]:
+    # (elevations, mask of points that got a real answer rather than a fallback)
+    out = np.full(len(coords), 50.0)
+    ok = np.zeros(len(coords), dtype=bool)
+    for start in range(0, len(coords), ELEV_BATCH):
+        chunk = coords[start:start + ELEV_BATCH]
+        payload = {"locations": [{"latitude": float(la), "longitude": float(lo)} for la, lo in chunk]}
+        try:
+            r = _SESSION.post(OPEN_ELEV, json=payload, timeout=REQUEST_TIMEOUT)
+        except requests.RequestException:
+            out[start:start + len(chunk)] = np.nan
+            continue
+        if r.status_code != 200:
+            continue
+        try:
+            elev = [float(res["elevation"]) for res in r.json().get("results", [])[:len(chunk)]]
+        except (ValueError, KeyError, TypeError, AttributeError):
+            # an HTML error page or truncated body: only this chunk's points are lost
+            out[start:start + len(chunk)] = np.nan
+            continue
+        out[start:start + len(elev)] = elev
+        ok[start:start + len(elev)] = True
+    return out, ok
+
+def flood_risk_vec(elev: np.ndarray) -> np.ndarray:
+    """flood_risk_score's elevation bands applied to an array of elevations (NaN stays NaN)."""
+    elev = np.asarray(elev, dtype=float)
+    scores = np.select([elev < 3, elev < 10, elev < 50, elev < 200], [95.0, 80.0, 55.0, 30.0], default=15.0)
+    return np.where(np.isnan(elev), np.nan, scores)
+
 def flood_risk_score(lat: float, lon: float) -> float:
     elev = elevation_meters(lat, lon)
     # naive mapping: <3m extremely high, 3–10m high, 10–50m moderate, >50m low
@@ -56,7 +119,80 @@ def flood_risk_score(lat: float, lon: float) -> float:
     return 15.0
 
 def climate_risk_0_100(lat: float, lon: float) -> float:
-    heat = heat_risk_score(lat, lon)
-    flood = flood_risk_score(lat, lon)
-    # MVP: equal average of two sub-risks (0-100 higher = worse)
-    return (heat + flood) / 2.0
+    """
+    Heat/flood average at the centre of the CLIMATE_GRID cell holding (lat, lon),
+    memoized per cell. NaN if the climate APIs cannot be reached.
+    """
+    return float(_score_cells([_grid_cell(lat, lon)], max_workers=2)[0])
+
+def climate_risk_vec(lats: np.ndarray, lons: np.ndarray, max_workers: int = 8) -> np.ndarray:
+    """
+    climate_risk_0_100 over 1-D coordinate arrays. Points in the same grid cell
+    share one lookup; heat lookups run concurrently while elevations are fetched in batch.
+    NaN coordinates (e.g. failed geocodes) and failed lookups come back as NaN.
+    """
+    lats = np.asarray(lats, dtype=float)
+    lons = np.asarray(lons, dtype=float)
+    out = np.full(lats.shape, np.nan)
+    idx = np.flatnonzero(~(np.isnan(lats) | np.isnan(lons)))
+    if idx.size == 0:
+        return out
+
+    cells = [_grid_cell(la, lo) for la, lo in zip(lats[idx], lons[idx])]
+    uniq = list(dict.fromkeys(cells))
+    by_cell = dict(zip(uniq, _score_cells(uniq, max_workers=max_workers)))
+    out[idx] = [by_cell[c] for c in cells]
+    return out
+
+_CELL_CACHE_MAX = 100_000
+_cell_cache: Dict[Tuple[int, int], float] = {}
+# cell scores persisted across runs (~/.cache/casandra/climate.sqlite)
+_disk = DiskCache("climate", ttl=CLIMATE_CACHE_TTL)
+
+def _grid_cell(lat: float, lon: float) -> Tuple[int, int]:
+    return (round(float(lat) * CLIMATE_GRID), round(float(lon) * CLIMATE_GRID))
+
+def _disk_key(cell: Tuple[int, int]) -> str:
+    return f"{CLIMATE_GRID}:{cell[0]}:{cell[1]}"  # grid size in the key: a new grid starts fresh
+
+def _score_cells(cells: List[Tuple[int, int]], max_workers: int) -> np.ndarray:
+    # Only scores built from two real API answers are memoized; neutral
+    # fallbacks (bad status) are recomputed on the next call.
+    out = np.array([_cell_cache.get(c, np.nan) for c in cells])
+    todo = []
+    for j, c in enumerate(cells):
+        if not np.isnan(out[j]):  # memory hit (only real scores are cached, never NaN)
+            continue
+        hit = _disk.get(_disk_key(c))
+        if hit is MISSING:
+            todo.append(j)
+        else:
+            remember(_cell_cache, c, hit, _CELL_CACHE_MAX)
+            out[j] = hit
+    if not todo:
+        return out
+    centres = [(cells[j][0] / CLIMATE_GRID, cells[j][1] / CLIMATE_GRID) for j in todo]
+
+    def _heat(pt: Tuple[float, float]) -> Tuple[float, bool]:
+        try:
+            return _heat_from_temp(_july_max_temp(round(pt[0], 3), round(pt[1], 3))), True
+        except requests.HTTPError:
+            return 50.0, False
+        except requests.RequestException:
+            return np.nan, False
+
+    # heat and flood hit two different APIs: issue both at once
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        heat_it = ex.map(_heat, centres)  # submitted now, collected below
+        elev, elev_ok = _elevations(centres)
+        heat_res = list(heat_it)
+    flood = flood_risk_vec(elev)
+
+    for k, j in enumerate(todo):
+        heat, heat_ok = heat_res[k]
+        # MVP: equal average of two sub-risks (0-100 higher = worse)
+        out[j] = (heat + flood[k]) / 2.0
+        if heat_ok and elev_ok[k]:
+            remember(_cell_cache, cells[j], float(out[j]), _CELL_CACHE_MAX)
+            _disk.set(_disk_key(cells[j]), float(out[j]))
+    return out
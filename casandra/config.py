@@ -4,11 +4,15 @@ Central settings:
 - timeouts/rate limits
 - factor weights (default 33/33/33)
 - lookback windows (1y/5y/10y)
+- on-disk cache location
 '''
 
+import os
+
 # Fill these in before running
 SEC_USER_AGENT = "JavierSanjuan ESCP javier.sanjuan@edu.escp.eu"
 REQUEST_TIMEOUT = 30 # This tells Python to stop waiting after 30 seconds if a website doesn’t respond. (Prevents your code from freezing forever on a slow connection.)
+NOMINATIM_RPS = 1.0  # OpenStreetMap's usage policy: at most one geocode per second
 REQUEST_SLEEP = 2  # This adds a 0.6-second pause between requests to the SEC. (Prevents sending too many requests too fas
 
 # Metric weights (sum to 1.0). Keep them configurable.
@@ -28,3 +32,8 @@ NEWS_QUERIES = [
     "{name} lawsuit",
     "{name} ESG",
 ]
+
+# On-disk cache for slow lookups (geocodes, climate cells, filings). Override with CASANDRA_CACHE_DIR.
+CACHE_DIR = os.environ.get("CASANDRA_CACHE_DIR", os.path.join("~", ".cache", "casandra"))
+GEOCODE_CACHE_TTL = 30 * 24 * 3600  # seconds; addresses rarely move
+CLIMATE_CACHE_TTL = 180 * 24 * 3600  # per grid cell; the projections behind it are static
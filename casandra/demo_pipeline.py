@@ -17,17 +17,19 @@ End-to-end demo for a single REIT:
 
 from __future__ import annotations
 from statistics import mean
-import pandas as pd
-import time
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
 
 from .config import SEC_USER_AGENT
-from .edgar_scraper import download_10k_text
-from .property_parser import extract_item2_tables_html, parse_property_addresses, extract_addresses_from_table0_col0
+from .edgar_scraper import download_10k_bytes
+from .property_parser import extract_item2_tables_html, parse_property_addresses, extract_addresses_from_item2_html
 from .geocode import geocode_address
-from .climate_risk import climate_risk_0_100
-from .carbon_intensity import carbon_intensity_kg_per_sqm, carbon_score_0_100, carbon_intensity_from_csv
-from .governance_sentiment import governance_risk_score_0_100
-from .scoring import combine_scores
+from .climate_risk import climate_risk_vec
+from .carbon_intensity import carbon_score_0_100, carbon_intensity_from_csv
+from .governance_sentiment import governance_risk_scores_0_100, _sia
+from .scoring import score_portfolio, format_score
 from pathlib import Path
 
 # Try repo-root default: <repo_root>/carbon_inputs.csv
@@ -35,9 +37,56 @@ _DEFAULT_CARBON_CSV = "carbon_inputs.csv"
 
 WINDOWS = {"1y": 365, "5y": 365*5, "10y": 365*10}
 MAX_NUM_PROP_PARSED = 10
+MAX_PROPERTY_WORKERS = 8  # properties processed concurrently (geocode -> climate)
+MAX_REIT_WORKERS = 4      # REITs scored concurrently by score_reits
 GEOCODE_UA = "Casandra/0.1 (javiersanjuanmadrid@gmail.com)"
 
 
+@dataclass(frozen=True)
+class ReitSpec:
+    """Identifies one REIT to score."""
+    cik: str
+    name: str
+    ticker: str
+
+
+@dataclass
+class ReitContext:
+    """
+    One REIT's latest 10-K, downloaded and parsed once so every stage shares it:
+    raw HTML bytes, the Item 2 tables HTML and the property addresses from table 0.
+    """
+    cik: str
+    html: bytes
+    item2_html: Optional[str]
+    addresses: List[str]
+
+    @classmethod
+    def from_cik(cls, cik: str) -> "ReitContext":
+        html = download_10k_bytes(cik)
+        item2_html = extract_item2_tables_html(html)
+        addresses = extract_addresses_from_item2_html(item2_html)
+        return cls(cik=cik, html=html, item2_html=item2_html, addresses=addresses)
+
+
+def _geocode_one(addr: str) -> Tuple[float, float, Optional[str]]:
+    """
+    Geocode one property.
+    Returns (lat, lon, failure); NaN coordinates where geocoding failed.
+    """
+    nan = float("nan")
+    if not addr:
+        return nan, nan, "missing address"
+
+    try:
+        g = geocode_address(addr, user_agent=GEOCODE_UA)  # rate-limited inside
+    except Exception as e:
+        return nan, nan, f"geocode exception: {e}"
+
+    if not g or "lat" not in g or "lon" not in g:
+        return nan, nan, "no coordinates"
+    return float(g["lat"]), float(g["lon"]), None
+
 
 def score_reit(
     *,
@@ -47,58 +96,48 @@ def score_reit(
     carbon_csv: str | None = None
 ) -> dict:
     
-    # 1) filings -> addresses
-    filing_text = download_10k_text(cik)
-    print("Downloaded 10-K length:", len(filing_text or ""))
-    # print("First 300 chars:", (filing_text or "")[:300])
-    # item2_text = extract_item2_tables_html(filing_text)
-    # props = parse_property_addresses(item2_text)
-    # props = extract_addresses_from_table0_col0(item2_text)
-
-    props_df = extract_addresses_from_table0_col0(cik)
-    props = props_df.to_dict("records")  # convert to list of dicts like [{'address': 'One Penn Plaza'}, ...]
-    props = props[:MAX_NUM_PROP_PARSED]
-
-    # 2) geocode & climate scores
-    c_scores = []
+    # Governance only needs the name: fetch/score the news in the background
+    # while the filing, geocoding and climate phases run.
+    gov_pool = ThreadPoolExecutor(max_workers=1)
+    gov_future = gov_pool.submit(governance_risk_scores_0_100, name, WINDOWS)
+    gov_pool.shutdown(wait=False)  # the submitted task still runs to completion
+
+    # 1) filing -> Item 2 -> addresses (one download, one parse)
+    ctx = ReitContext.from_cik(cik)
+    print("Downloaded 10-K length:", len(ctx.html or ""))
+
+    # 2) geocode & climate scores, kept as parallel arrays (one slot per property)
+    addresses = np.array(ctx.addresses[:MAX_NUM_PROP_PARSED], dtype=object)
+    lats = np.full(len(addresses), np.nan)
+    lons = np.full(len(addresses), np.nan)
+    c_scores = np.full(len(addresses), np.nan)
     failures = []
 
-    for p in props:
-        addr = p.get("address") or p.get("full_address") or ""
-        if not addr:
-            failures.append(("missing address", p))
-            continue
-
-        try:
-            g = geocode_address(addr, user_agent=GEOCODE_UA)
-        except Exception as e:
-            failures.append((f"geocode exception: {e}", addr))
-            continue
-
-        if not g or "lat" not in g or "lon" not in g:
-            failures.append(("no coordinates", addr))
-            continue
-
-        try:
-            score = climate_risk_0_100(float(g["lat"]), float(g["lon"]))
-            if score is not None:
-                c_scores.append(float(score))
-            else:
-                failures.append(("climate_risk returned None", addr))
-        except Exception as e:
-            failures.append((f"climate exception: {e}", addr))
-
-        time.sleep(1.0)  # be nice to the geocoder/rate limits
-
-    climate = (sum(c_scores) / len(c_scores)) if c_scores else 50.0
+    # geocodes run concurrently (rate-limited; cached ones skip the limiter entirely)
+    with ThreadPoolExecutor(max_workers=MAX_PROPERTY_WORKERS) as ex:
+        for i, (lat, lon, failure) in enumerate(ex.map(_geocode_one, addresses)):
+            lats[i], lons[i] = lat, lon
+            if failure:
+                failures.append((failure, addresses[i]))
+
+    # then one climate call for every coordinate: properties in the same grid cell share
+    # one lookup and all elevations go out in a single batched POST
+    try:
+        c_scores = climate_risk_vec(lats, lons, max_workers=MAX_PROPERTY_WORKERS)
+    except Exception as e:
+        failures.append((f"climate exception: {e}", None))
+    else:
+        for i in np.flatnonzero(np.isnan(c_scores) & ~np.isnan(lats)):
+            failures.append(("climate lookup failed", addresses[i]))
+    used = ~np.isnan(c_scores)
+
+    climate = float(np.nanmean(c_scores)) if used.any() else 50.0  # neutral if nothing parsed
     print("climate :", climate)
-    # climate = mean(c_scores) if c_scores else 50.0  # neutral if nothing parsed
 
 
     # 3) carbon intensity
     # row = get_carbon_row(ticker=ticker, cik=cik, company_name=name)
-    # carbon_df = pd.DataFrame([row])  # dynamic DataFrame only
-    # ci_kg_per_sqm = carbon_intensity_kg_per_sqm(carbon_df, ticker)
+    # ci_kg_per_sqm = carbon_intensity_from_row(row)  # single dict row, no DataFrame
     # carbon = carbon_score_0_100(ci_kg_per_sqm)
     carbon_csv = carbon_csv or str(_DEFAULT_CARBON_CSV)
     ci = carbon_intensity_from_csv(carbon_csv, ticker)
@@ -107,24 +146,52 @@ def score_reit(
     print("carbon :", carbon)
 
 
-    # 4) governance
-    gov_1y = governance_risk_score_0_100(name, WINDOWS["1y"])
-    gov_5y = governance_risk_score_0_100(name, WINDOWS["5y"])
-    gov_10y = governance_risk_score_0_100(name, WINDOWS["10y"])
+    # 4) governance: one news fetch, filtered per window (started above)
+    gov = gov_future.result()
+    gov_1y, gov_5y, gov_10y = gov["1y"], gov["5y"], gov["10y"]
 
-    # Combine
-    esg_1y = combine_scores(climate, carbon, gov_1y)
-    esg_5y = combine_scores(climate, carbon, gov_5y)
-    esg_10y = combine_scores(climate, carbon, gov_10y)
+    # Combine: the three horizons as one (3, 3) matrix-vector product
+    esg_1y, esg_5y, esg_10y = score_portfolio([
+        [climate, carbon, gov_1y],
+        [climate, carbon, gov_5y],
+        [climate, carbon, gov_10y],
+    ])
 
     return {
-        "climate_score": round(float(climate), 2),
-        "carbon_score": round(float(carbon), 2),
-        "gov_score_1y": round(float(gov_1y), 2),
-        "gov_score_5y": round(float(gov_5y), 2),
-        "gov_score_10y": round(float(gov_10y), 2),
-        "final_esg_1y": round(float(esg_1y), 2),
-        "final_esg_5y": round(float(esg_5y), 2),
-        "final_esg_10y": round(float(esg_10y), 2),
-        "n_properties_used": len(c_scores),
+        "climate_score": format_score(climate),
+        "carbon_score": format_score(carbon),
+        "gov_score_1y": format_score(gov_1y),
+        "gov_score_5y": format_score(gov_5y),
+        "gov_score_10y": format_score(gov_10y),
+        "final_esg_1y": format_score(esg_1y),
+        "final_esg_5y": format_score(esg_5y),
+        "final_esg_10y": format_score(esg_10y),
+        "n_properties_used": int(used.sum()),
     }
+
+
+def score_reits(reits: List[ReitSpec], carbon_csv: str | None = None) -> List[dict]:
+    """
+    score_reit over a batch of REITs, a few at a time. Runs in threads so every
+    REIT shares the pooled sessions, the rate limiters and the in-process caches
+    (filings, geocodes, climate cells, news, carbon CSV).
+    Returns one dict per REIT, in input order, tagged with cik/name/ticker;
+    a REIT that fails gets an "error" entry instead of scores.
+    """
+    if not reits:
+        return []
+    carbon_csv = carbon_csv or str(_DEFAULT_CARBON_CSV)
+    # pay the one-off costs once, before the workers race for them
+    carbon_intensity_from_csv(carbon_csv, "")
+    _sia()
+
+    def _one(spec: ReitSpec) -> dict:
+        out = {"cik": spec.cik, "name": spec.name, "ticker": spec.ticker}
+        try:
+            out.update(score_reit(cik=spec.cik, name=spec.name, ticker=spec.ticker, carbon_csv=carbon_csv))
+        except Exception as e:
+            out["error"] = str(e)
+        return out
+
+    with ThreadPoolExecutor(max_workers=min(MAX_REIT_WORKERS, len(reits))) as ex:
+        return list(ex.map(_one, reits))
@@ -0,0 +1,60 @@
+'''
+Small persistent key/value cache: one SQLite file per namespace under CACHE_DIR,
+JSON values, per-entry TTL. Backs the in-process caches so lookups survive restarts.
+The cache is best-effort: any storage error behaves like a miss.
+Also home to remember(), the bounded insert shared by the in-process dict caches.
+'''
+
+import json, os, sqlite3, threading, time
+from typing import Any
+from .config import CACHE_DIR
+
+MISSING = object()  # get() default, so a cached None ("no match") is distinguishable
+
+_EVICT_LOCK = threading.Lock()
+
+def remember(cache: dict, key: Any, value: Any, maxsize: int) -> None:
+    """
+    Store into a bounded in-process dict cache, evicting the oldest entry when full.
+    Worker threads share these caches: the evict-then-insert runs under one lock,
+    so two threads can't both pick (and pop) the same oldest key. Plain reads need no lock.
+    """
+    with _EVICT_LOCK:
+        if key not in cache and len(cache) >= maxsize:
+            cache.pop(next(iter(cache)), None)
+        cache[key] = value
+
+class DiskCache:
+    def __init__(self, name: str, ttl: float):
+        self.path = os.path.join(os.path.expanduser(CACHE_DIR), f"{name}.sqlite")
+        self.ttl = ttl
+        self._lock = threading.Lock()  # one connection shared across threads
+        self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            conn.execute("CREATE TABLE IF NOT EXISTS kv (key TEXT PRIMARY KEY, value TEXT NOT NULL, ts REAL NOT NULL)")
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str, default: Any = MISSING) -> Any:
+        try:
+            with self._lock:
+                row = self._connect().execute("SELECT value, ts FROM kv WHERE key = ?", (key,)).fetchone()
+        except (sqlite3.Error, OSError):
+            return default
+        if row is None or time.time() - row[1] > self.ttl:
+            return default
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute("INSERT OR REPLACE INTO kv (key, value, ts) VALUES (?, ?, ?)",
+                             (key, json.dumps(value), time.time()))
+                conn.commit()
+        except (sqlite3.Error, OSError):
+            pass
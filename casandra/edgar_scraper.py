@@ -3,21 +3,37 @@ Talks to SEC EDGAR. Finds the latest 10-K for a CIK (Central Index Key, every co
 Returns raw text for parsing.
 '''
 
-import time, requests
-from typing import Dict, Any
-from .config import SEC_USER_AGENT, REQUEST_TIMEOUT, REQUEST_SLEEP
+import codecs, gzip, io, os, re, tempfile
+from functools import lru_cache
+from typing import BinaryIO, Dict, Any, Iterable, Tuple
+from .config import SEC_USER_AGENT, REQUEST_TIMEOUT, REQUEST_SLEEP, CACHE_DIR
+from .http_utils import make_session, RateLimiter
 
 BASE = "https://data.sec.gov"
 
 HEADERS = {"User-Agent": SEC_USER_AGENT, "Accept-Encoding": "gzip, deflate"}
 
+# keep-alive to data.sec.gov (submissions) and www.sec.gov (archives); headers set once
+_SESSION = make_session(pool_connections=4, pool_maxsize=8, headers=HEADERS)
+# SEC requests start at least REQUEST_SLEEP seconds apart (shared by every thread)
+_SEC_LIMITER = RateLimiter(1.0 / REQUEST_SLEEP)
+
+# Filings never change once published: keep each primary document on disk,
+# gzipped, named after its accession number (~/.cache/casandra/edgar/<cik>_<acc>.html.gz)
+FILING_CACHE_DIR = os.path.join(os.path.expanduser(CACHE_DIR), "edgar")
+
 def get_submissions(cik_nozeros: str) -> Dict[str, Any]:
     url = f"{BASE}/submissions/CIK{cik_nozeros.zfill(10)}.json"
-    r = requests.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
+    with _SEC_LIMITER:
+        r = _SESSION.get(url, timeout=REQUEST_TIMEOUT)
     r.raise_for_status()
     return r.json()
 
 def latest_10k_primary_doc_url(cik_nozeros: str) -> str:
+    return latest_10k_filing(cik_nozeros)[1]
+
+def latest_10k_filing(cik_nozeros: str) -> Tuple[str, str]:
+    """(accession number without dashes, primary document URL) of the latest 10-K."""
     data = get_submissions(cik_nozeros)
     filings = data.get("filings", {}).get("recent", {})
     forms = filings.get("form", [])
@@ -28,17 +44,106 @@ def latest_10k_primary_doc_url(cik_nozeros: str) -> str:
             # Convert CIK + accession to archive URL
             acc_nodash = a.replace("-", "")
             url = f"https://www.sec.gov/Archives/edgar/data/{int(cik_nozeros)}/{acc_nodash}/{p}"
-            time.sleep(REQUEST_SLEEP)
-            return url
+            return acc_nodash, url
     raise RuntimeError("No 10-K found in recent filings.")
 
-def download_10k_text(cik_nozeros: str) -> str:
-    url = latest_10k_primary_doc_url(cik_nozeros)
-    r = requests.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
+def download_10k_bytes(cik_nozeros: str, force_refresh: bool = False) -> bytes:
+    """
+    Raw bytes of the latest 10-K primary document. The parser works on bytes
+    directly, so the multi-MB filing is never decoded to str just to be re-encoded.
+    Served from the on-disk filing cache when present; force_refresh re-downloads.
+    """
+    if force_refresh:
+        _download_10k_bytes.cache_clear()
+    # "0000899689" and "899689" are the same filer: share one cache entry
+    return _download_10k_bytes(str(int(cik_nozeros)), force_refresh)
+
+def download_10k_text(cik_nozeros: str, force_refresh: bool = False) -> str:
+    data = download_10k_bytes(cik_nozeros, force_refresh)
+    # the cached bytes keep no response headers: go by the charset the filing declares
+    return data.decode(_sniff_encoding(data), errors="replace")
+
+# declared charset in an <?xml ...?> declaration or <meta>, looked for near the top
+_DECLARED_ENC_RE = re.compile(rb"""(?:encoding|charset)\s*=\s*["']?([A-Za-z0-9_.:-]+)""", re.I)
+
+def _sniff_encoding(data: bytes) -> str:
+    m = _DECLARED_ENC_RE.search(data, 0, 4096)
+    if m:
+        try:
+            name = codecs.lookup(m.group(1).decode("ascii")).name
+        except LookupError:
+            pass
+        else:
+            # "us-ascii" filings still carry the odd cp1252 smart quote: read them as its superset
+            return "cp1252" if name == "ascii" else name
+    return "utf-8"
+
+def open_10k(cik_nozeros: str) -> BinaryIO:
+    """
+    The latest 10-K primary document as a seekable binary file, for callers that
+    scan it rather than hold it: a gzip stream over the on-disk filing cache.
+    On a miss the download is streamed into the cache first, so the filing is
+    never held in memory (unless the cache directory is unwritable).
+    """
+    cik_nozeros = str(int(cik_nozeros))
+    acc_nodash, url = latest_10k_filing(cik_nozeros)  # resolved once, for both paths
+    path = _filing_path(cik_nozeros, acc_nodash)
+    try:
+        return gzip.open(path, "rb")
+    except OSError:
+        pass  # not cached yet: download below
+
+    with _SEC_LIMITER:
+        r = _SESSION.get(url, timeout=REQUEST_TIMEOUT, stream=True)
+    with r:
+        r.raise_for_status()
+        if _store_filing(path, r.iter_content(chunk_size=1 << 16)):
+            return gzip.open(path, "rb")
+
+    # cache not writable: fall back to holding this one download in memory
+    with _SEC_LIMITER:
+        r = _SESSION.get(url, timeout=REQUEST_TIMEOUT)
+    r.raise_for_status()
+    return io.BytesIO(r.content)
+
+def _filing_path(cik_nozeros: str, acc_nodash: str) -> str:
+    return os.path.join(FILING_CACHE_DIR, f"{cik_nozeros}_{acc_nodash}.html.gz")
+
+@lru_cache(maxsize=8)  # filings are multi-MB; only keep the last few per process
+def _download_10k_bytes(cik_nozeros: str, force_refresh: bool) -> bytes:
+    acc_nodash, url = latest_10k_filing(cik_nozeros)
+    path = _filing_path(cik_nozeros, acc_nodash)
+    if not force_refresh:
+        try:
+            with gzip.open(path, "rb") as f:
+                return f.read()
+        except (OSError, EOFError):
+            pass  # not cached yet (or unreadable): download below
+
+    with _SEC_LIMITER:
+        r = _SESSION.get(url, timeout=REQUEST_TIMEOUT)
     r.raise_for_status()
-    # Some filings are HTML; return raw text for downstream parsing
-    return r.text
+    data = r.content  # gzip already undone by requests; no charset decoding
+    _store_filing(path, (data,))
+    return data
 
+def _store_filing(path: str, chunks: Iterable[bytes]) -> bool:
+    # write to a temp file then rename: readers never see a partial filing.
+    # The disk copy is best-effort: False if it could not be written.
+    try:
+        os.makedirs(FILING_CACHE_DIR, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=FILING_CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as gz:
+                for chunk in chunks:
+                    gz.write(chunk)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        return False
+    return True
 
 if __name__ == "__main__":
     # Example: test a few public companies
@@ -3,20 +3,45 @@ Turns each address into lat/lon using OpenStreetMap Nominatim (polite rate limit
 Output: {"lat": …, "lon": …, "display_name": …} for each address.
 '''
 
-import time, requests
+import threading
 from typing import Dict, Optional
-from .config import REQUEST_TIMEOUT
+from .config import REQUEST_TIMEOUT, GEOCODE_CACHE_TTL, NOMINATIM_RPS
+from .disk_cache import DiskCache, MISSING, remember
+from .http_utils import make_session, RateLimiter
 
 NOMINATIM = "https://nominatim.openstreetmap.org/search"
+_SESSION = make_session(pool_connections=1, pool_maxsize=2)  # one host, one request at a time
+# be polite: one request in flight, starts spaced by 1/NOMINATIM_RPS (cache hits skip both)
+_IN_FLIGHT = threading.Lock()
+_LIMITER = RateLimiter(NOMINATIM_RPS)
+
+# Lookups keyed by normalized address. Misses ("no such place") are cached too,
+# HTTP errors are not so a transient failure can be retried.
+_CACHE_MAX = 4096
+_cache: Dict[str, Optional[Dict]] = {}
+# Same entries persisted across runs (~/.cache/casandra/geocode.sqlite, 30-day TTL)
+_disk = DiskCache("geocode", ttl=GEOCODE_CACHE_TTL)
 
 def geocode_address(addr: str, user_agent: str) -> Optional[Dict]:
+    key = addr.strip().lower()
+    hit = _cache.get(key, MISSING)  # one lookup: the entry may be evicted by another thread
+    if hit is not MISSING:
+        return dict(hit) if hit else None
+    hit = _disk.get(key)
+    if hit is not MISSING:
+        remember(_cache, key, hit, _CACHE_MAX)
+        return dict(hit) if hit else None
+
     params = {"q": addr, "format": "json", "limit": 1}
-    r = requests.get(NOMINATIM, params=params, headers={"User-Agent": user_agent}, timeout=REQUEST_TIMEOUT)
+    with _IN_FLIGHT, _LIMITER:
+        r = _SESSION.get(NOMINATIM, params=params, headers={"User-Agent": user_agent}, timeout=REQUEST_TIMEOUT)
     if r.status_code != 200:
         return None
     js = r.json()
-    if not js:
-        return None
-    # be polite
-    time.sleep(1)
-    return {"lat": float(js[0]["lat"]), "lon": float(js[0]["lon"]), "display_name": js[0]["display_name"]}
+    out = None
+    if js:
+        out = {"lat": float(js[0]["lat"]), "lon": float(js[0]["lon"]), "display_name": js[0]["display_name"]}
+
+    remember(_cache, key, out, _CACHE_MAX)
+    _disk.set(key, out)
+    return dict(out) if out else None
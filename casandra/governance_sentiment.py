@@ -3,23 +3,66 @@ Fetches Google News RSS headlines for the REIT name (within a lookback window)
 Runs VADER sentiment, and converts to a governance/controversy risk score (0–100).
 """
 
-import time, feedparser
-from datetime import datetime, timedelta, timezone
-from typing import List
-from nltk.sentiment import SentimentIntensityAnalyzer
-import nltk
+import calendar, time
+import numpy as np
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Tuple
 from urllib.parse import quote_plus
 
+if TYPE_CHECKING:
+    from nltk.sentiment import SentimentIntensityAnalyzer
 
-try:
-    _ = nltk.data.find('sentiment/vader_lexicon.zip')
-except LookupError:
-    nltk.download('vader_lexicon')
+# feedparser and nltk are imported on first use: importing the package stays cheap
 
 
-def fetch_news_titles(name: str, lookback_days: int):
-    now = datetime.now(timezone.utc)
-    since = now - timedelta(days=lookback_days)
+NEWS_CACHE_TTL = 3600  # seconds a fetched feed is reused for the same name
+
+
+@lru_cache(maxsize=1)
+def _sia() -> "SentimentIntensityAnalyzer":
+    # loading the VADER lexicon is the expensive part: once per process, on first use
+    import nltk
+    from nltk.sentiment import SentimentIntensityAnalyzer
+    try:
+        _ = nltk.data.find('sentiment/vader_lexicon.zip')
+    except LookupError:
+        nltk.download('vader_lexicon')
+    return SentimentIntensityAnalyzer()
+
+
+def fetch_news_items(name: str, max_window_days: int = 3650) -> List[Dict]:
+    """
+    Headlines for `name` published within the last `max_window_days`, as
+    [{"published": datetime, "title": str}, ...]. Shorter windows can be cut
+    from this list by date instead of re-fetching the feed.
+    """
+    return [{"published": published, "title": title} for published, title in fetch_news_titles_with_dates(name, max_window_days)]
+
+
+def fetch_news_titles_with_dates(name: str, max_days: int = 3650) -> List[Tuple[datetime, str]]:
+    """Same headlines as [(published, title), ...]."""
+    return [(datetime(*st[:6], tzinfo=timezone.utc), title) for st, title in _news_entries(name, max_days)]
+
+
+class _EmptyFeed(Exception):
+    """The feed came back with no entries (often a failed or timed-out fetch)."""
+
+
+def _news_entries(name: str, max_days: int) -> tuple:
+    # ((published UTC struct_time, title), ...); the time bucket gives the memoized feed a TTL
+    try:
+        return _fetch_news_items(name, max_days, int(time.time() // NEWS_CACHE_TTL))
+    except _EmptyFeed:
+        return ()  # not memoized: the next call fetches again
+
+
+@lru_cache(maxsize=32)
+def _fetch_news_items(name: str, lookback_days: int, _ttl_bucket: int) -> tuple:
+    # feedparser already hands out UTC struct_times: filter on those (plain tuple
+    # comparison) rather than building a datetime per entry
+    now = time.gmtime()
+    since = time.gmtime(time.time() - lookback_days * 86400)
 
     # Build and ENCODE the query
     q_raw = f"{name} REIT governance OR controversy OR lawsuit"
@@ -28,26 +71,66 @@ def fetch_news_titles(name: str, lookback_days: int):
     url = f"https://news.google.com/rss/search?q={q}&hl=en-GB&gl=GB&ceid=GB:en"
 
     # Optional: be polite with a UA; feedparser supports request headers
+    import feedparser
     d = feedparser.parse(url, request_headers={"User-Agent": "REITVision ESG (contact: your.email@domain.com)"})
+    if not d.entries:
+        # feedparser reports network errors as an empty feed: raise so lru_cache keeps nothing
+        raise _EmptyFeed(getattr(d, "bozo_exception", None))
 
-    titles = []
-    for e in d.entries[:50]:  # small cap to avoid runaway loops
-        try:
-            published = datetime(*e.published_parsed[:6], tzinfo=timezone.utc)
-        except Exception:
-            published = now
-        if published >= since:
-            titles.append(e.title)
-    return titles
+    entries = d.entries[:50]  # small cap to avoid runaway loops
+    dated = ((getattr(e, "published_parsed", None) or now, e.title) for e in entries)  # undated -> now
+    return tuple((st, title) for st, title in dated if st >= since)
 
 
-def governance_risk_score_0_100(name: str, lookback_days: int) -> float:
-    titles = fetch_news_titles(name, lookback_days)
+def fetch_news_titles(name: str, lookback_days: int):
+    return [it["title"] for it in fetch_news_items(name, lookback_days)]
+
+
+def governance_risk_from_titles(titles: List[str]) -> float:
     if not titles:
         return 50.0
-    sia = SentimentIntensityAnalyzer()
-    scores = [sia.polarity_scores(t)["compound"] for t in titles]
-    avg = sum(scores) / len(scores)
+    sia = _sia()
+    return _risk_from_compounds([sia.polarity_scores(t)["compound"] for t in titles])
+
+
+def _risk_from_compounds(scores: List[float]) -> float:
+    if not scores:
+        return 50.0
+    return _risk_from_mean(sum(scores) / len(scores))
+
+
+def _risk_from_mean(avg: float) -> float:
     # Map compound (-1..1) to 0..100 where -1 -> 95 (high risk), +1 -> 5 (low risk)
     risk = 50 - avg * 45
     return max(0, min(100, risk))
+
+
+def governance_risk_score_0_100(name: str, lookback_days: int) -> float:
+    return governance_risk_from_titles(fetch_news_titles(name, lookback_days))
+
+
+def governance_risk_scores_0_100(name: str, windows: Dict[str, int]) -> Dict[str, float]:
+    """
+    Governance risk for several lookback windows ({"1y": 365, ...}) from a
+    single feed fetch: each headline is scored once, and each window is the
+    tail of the date-sorted list (newer than its cutoff).
+    """
+    items = _news_entries(name, max(windows.values()))
+    if not items:
+        return {key: 50.0 for key in windows}
+
+    sia = _sia()
+    ts = np.fromiter((calendar.timegm(st) for st, _ in items), dtype=np.float64, count=len(items))
+    compounds = np.fromiter((sia.polarity_scores(title)["compound"] for _, title in items), dtype=np.float64, count=len(items))
+    order = np.argsort(ts, kind="stable")
+    ts = ts[order]
+    # cum[i] = sum of the i oldest compounds, so any "newer than cutoff" tail sums in O(1)
+    cum = np.concatenate(([0.0], np.cumsum(compounds[order])))
+
+    now = time.time()
+    out = {}
+    for key, days in windows.items():
+        i = int(np.searchsorted(ts, now - days * 86400, side="left"))
+        n = len(ts) - i
+        out[key] = _risk_from_mean(float(cum[-1] - cum[i]) / n) if n else 50.0
+    return out
@@ -0,0 +1,60 @@
+'''
+Shared HTTP plumbing: pooled requests sessions with retry/backoff, and a
+thread-safe rate limiter for APIs with a requests-per-second policy.
+One session per API host means repeated calls reuse the same TCP/TLS connection.
+'''
+
+import threading, time
+import requests
+from typing import Dict, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+def make_session(pool_connections: int = 16, pool_maxsize: int = 32, headers: Optional[Dict[str, str]] = None) -> requests.Session:
+    """
+    Session with keep-alive pooling and up to 3 retries (exponential backoff) on
+    connection errors and 429/5xx. After the last retry the final response is
+    returned as-is, so callers keep their own status_code handling.
+    """
+    # POST is only used for read-only batch lookups, so it is safe to retry too
+    retry = Retry(
+        total=3, backoff_factor=0.5, status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"GET", "POST"}), raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
+    s = requests.Session()
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    if headers:
+        s.headers.update(headers)
+    return s
+
+
+class RateLimiter:
+    """
+    Keeps call starts at least 1/rps seconds apart, across threads. Each caller
+    reserves the next free slot under the lock and sleeps only for what is left
+    of the interval, so a slow previous request is not followed by a full pause.
+    Usage: `with limiter: r = session.get(...)`.
+    """
+    def __init__(self, rps: float):
+        self.interval = 1.0 / rps
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+    def __enter__(self) -> "RateLimiter":
+        self.wait()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
@@ -5,8 +5,10 @@ based on Casandra ESG scores using linear coefficients.
 from __future__ import annotations
 
 import json
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Sequence
 from .demo_pipeline import score_reit
 
 def get_current_price_yf(ticker: str) -> float:
@@ -55,6 +57,23 @@ def _linear_adjustment(score: float, beta: float) -> float:
     s = max(0.0, min(100.0, float(score)))
     return beta * (50.0 - s) / 50.0 # Transform the score into a number bw -1 and 1 times the beta of each scenario
 
+def _linear_adjustments(scores, betas) -> np.ndarray:
+    """_linear_adjustment broadcast over arrays: (..., 3) scores against (3,) betas."""
+    s = np.clip(np.asarray(scores, dtype=float), 0.0, 100.0)
+    return np.asarray(betas, dtype=float) * (50.0 - s) / 50.0
+
+def project_prices_batch(
+    current_prices: Sequence[float],
+    final_esg: Sequence[Sequence[float]],
+    betas: Sequence[float] = (0.10, 0.20, 0.30),
+) -> np.ndarray:
+    """Projected 1y/5y/10y prices for N REITs at once.
+
+    current_prices has shape (N,), final_esg shape (N, 3) (1y, 5y, 10y scores);
+    returns an (N, 3) array. Same rule as project_prices_from_scores.
+    """
+    return np.asarray(current_prices, dtype=float)[:, None] * (1.0 + _linear_adjustments(final_esg, betas))
+
 # Returns a class object with all the prices and adjustments
 def project_prices_from_scores(
     current_price: float,
@@ -73,13 +92,9 @@ def project_prices_from_scores(
       5y:  ±20%   (beta_5y=0.20)
       10y: ±30%   (beta_10y=0.30)
     """
-    adj1 = _linear_adjustment(final_esg_1y, beta_1y)
-    adj5 = _linear_adjustment(final_esg_5y, beta_5y)
-    adj10 = _linear_adjustment(final_esg_10y, beta_10y)
-
-    p1 = current_price * (1.0 + adj1)
-    p5 = current_price * (1.0 + adj5)
-    p10 = current_price * (1.0 + adj10)
+    adj = _linear_adjustments([final_esg_1y, final_esg_5y, final_esg_10y], [beta_1y, beta_5y, beta_10y])
+    adj1, adj5, adj10 = (float(a) for a in adj)
+    p1, p5, p10 = (float(p) for p in current_price * (1.0 + adj))
 
     return Projections(
         current_price=current_price,
@@ -106,15 +121,17 @@ def run_price_projection(
     2) run Casandra scoring pipeline
     3) project 1y/5y/10y prices using simple coefficients
     """
-    # 1) current market price
-    current = get_current_price_yf(ticker)
-
-    # 2) ESG scores (uses the project's pipeline)
-    scores = score_reit(
-        cik=cik,
-        name=name,
-        ticker=ticker
-    )
+    # 1) current market price: independent of the pipeline, so fetch it meanwhile
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        price_future = ex.submit(get_current_price_yf, ticker)
+
+        # 2) ESG scores (uses the project's pipeline)
+        scores = score_reit(
+            cik=cik,
+            name=name,
+            ticker=ticker
+        )
+        current = price_future.result()
 
     # 3) price projections
     proj = project_prices_from_scores(
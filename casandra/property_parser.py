@@ -1,78 +1,283 @@
 '''
 Pulls the “Item 2. Properties” section from the 10-K and extracts location lines (tables/bullets). 
-Output: a deduplicated list like [{ "address": "City, ST | …" }, …].
+Output: a deduplicated list like [PropertyRecord(address="City, ST | …"), …].
 '''
 
 
 
-import re
-from bs4 import BeautifulSoup
-import pandas as pd
-from casandra.edgar_scraper import download_10k_text
+import hashlib, io, re, sys, threading
+from dataclasses import dataclass
+from typing import BinaryIO
+from lxml import etree
+from casandra.edgar_scraper import open_10k, _sniff_encoding
+from casandra.disk_cache import remember
+
+try:
+    import re2 as _re2  # optional (google-re2): linear-time matching on multi-MB filings
+except ImportError:
+    _re2 = None
+
+def _compile_scan(pattern: bytes):
+    """Compile a whole-document scan pattern with re2 when installed, else re."""
+    if _re2 is not None:
+        try:
+            # byte-oriented like re: re2's default UTF-8 mode would miss a lone Latin-1 NBSP
+            opts = _re2.Options()
+            opts.encoding = _re2.Options.Encoding.LATIN1
+            return _re2.compile(pattern, opts)
+        except Exception:
+            pass  # a construct re2 doesn't support: the stdlib engine handles everything
+    return re.compile(pattern)
 # from casandra.property_parser import extract_item2_tables_html
 
 
-# --- dynamic parser ---
-def _make_soup(html: str) -> BeautifulSoup:
-    s = html.lstrip().lower()
-    # Inline XBRL often starts with <?xml ...> but still has <html ...>
-    if s.startswith("<?xml") and "<html" not in s[:2000]:
-        return BeautifulSoup(html, features="xml")   # true XML without <html>
-    return BeautifulSoup(html, "lxml")               # default & XHTML case
+# --- streaming parser ---
+# encodings libxml2 decodes without ever failing: stray bytes in UTF-8 become U+FFFD,
+# and Latin-1 maps every byte. Any other codec aborts the parse on an unmappable byte.
+_LXML_SAFE_ENCODINGS = frozenset({"utf-8", "iso8859-1"})
+
+def _as_bytes(html: str | bytes, encoding: str | None = None) -> tuple[bytes, str]:
+    # lxml rejects str input that carries an <?xml ... encoding=...?> declaration,
+    # which inline XBRL 10-Ks usually start with: always hand it bytes + an explicit encoding
+    if isinstance(html, str):
+        return html.encode("utf-8"), "utf-8"
+    encoding = encoding or _sniff_encoding(html)
+    if encoding not in _LXML_SAFE_ENCODINGS:
+        # transcode ourselves so a bad byte is replaced rather than truncating the parse
+        return html.decode(encoding, errors="replace").encode("utf-8"), "utf-8"
+    return html, encoding
+
+def _iter_events(html: str | bytes, encoding: str | None = None):
+    data, encoding = _as_bytes(html, encoding)
+    return etree.iterparse(io.BytesIO(data), events=("start", "end"), html=True, encoding=encoding, huge_tree=True)
+
+# Fragments we produce ourselves (Item 2 tables) are small: parse them whole.
+# lxml parser objects must not be used from two threads at once, and score_reits
+# parses filings concurrently: one reusable parser per thread.
+_TLS = threading.local()
+
+def _html_parser() -> etree.HTMLParser:
+    parser = getattr(_TLS, "parser", None)
+    if parser is None:
+        # huge_tree: whole-document fallbacks can exceed libxml2's default safety limits
+        parser = _TLS.parser = etree.HTMLParser(encoding="utf-8", huge_tree=True)
+    return parser
+
+def _parse_html(html: str):
+    return etree.fromstring(html.encode("utf-8"), _html_parser())
+
+# a table's own rows, not those of tables nested in its cells
+_TABLE_ROWS = etree.XPath("./tr | ./thead/tr | ./tbody/tr | ./tfoot/tr")
 
 # --- robust section matchers (text only) ---
-SECTION_RE = re.compile(r'\bITEM[\s\u00A0]*2\b.*\bPROPERTIES\b', re.I)
-NEXT_RE    = re.compile(r'\bITEM[\s\u00A0]*3\b|\bPART[\s\u00A0]*II\b|\bSIGNATURES\b', re.I)
+# The markers are ASCII: re.A keeps \b/\d/case folding to ASCII tables (NBSP stays explicit).
+# _WS_RE/_MULTI_SPACE_RE stay Unicode so NBSP and friends still collapse.
+SECTION_RE = re.compile(r'\bITEM[\s\u00A0]*2\b.*\bPROPERTIES\b', re.I | re.A)
+NEXT_RE    = re.compile(r'\bITEM[\s\u00A0]*3\b|\bPART[\s\u00A0]*II\b|\bSIGNATURES\b', re.I | re.A)
+_WS_RE     = re.compile(r"\s+")
+_PAREN_NUM_RE   = re.compile(r"\(\d+\)", re.A)    # footnote markers, e.g. "One Penn Plaza (1)"
+_MULTI_SPACE_RE = re.compile(r"\s{2,}")
+_SKIP_RE        = re.compile(r"^(?:property|properties)$|\bSEGMENT\b", re.I | re.A)  # header / segment rows
+# tables without it can't have a 'Location' column
+_LOCATION_RE = re.compile(r"location", re.I | re.A)
+
+# --- same markers on the raw bytes (before parsing), to slice out Item 2 cheaply ---
+# \s is ASCII-only on bytes, so a raw NBSP (UTF-8 or Latin-1) is spelled out; the gap
+# between ITEM 2 and PROPERTIES is bounded so a miss can't scan a huge text run per 'ITEM'
+_RAW_SP          = rb"(?:\s|\xc2?\xa0|&nbsp;|&#160;|&#xa0;)"
+# inline (?i): re2's compile takes no flags argument
+_RAW_SECTION_RE  = _compile_scan(rb"(?i)\bITEM" + _RAW_SP + rb"*2\b[^<\n]{0,200}?\bPROPERTIES\b")   # within one text node
+_RAW_NEXT_RE     = _compile_scan(rb"(?i)>" + _RAW_SP + rb"*(?:ITEM" + _RAW_SP + rb"*3\b|PART" + _RAW_SP + rb"*II\b|SIGNATURES\b)")
 
-def extract_item2_tables_html(html: str) -> str | None:
+_RAW_TABLE_TAG_RE = _compile_scan(rb"(?i)<(/?)table\b")
+
+def _close_open_tables(html: bytes | bytearray, start: int, end: int) -> int | None:
+    """
+    `end` moved past the </table> that closes every table still open there, so a
+    next-section marker inside a table cell ("Part II ...") doesn't cut the table
+    short. None if the data runs out first.
+    """
+    depth = 0
+    for m in _RAW_TABLE_TAG_RE.finditer(html, start, end):
+        depth = max(depth - 1, 0) if m.group(1) else depth + 1
+    if not depth:
+        return end
+    for m in _RAW_TABLE_TAG_RE.finditer(html, end):
+        depth += -1 if m.group(1) else 1
+        if not depth:
+            close = html.find(b">", m.end())
+            return close + 1 if close != -1 else None
+    return None
+
+def _locate_item2_slice(html: bytes) -> bytes | None:
+    """
+    Cut the raw HTML from the first 'Item 2 ... Properties' heading up to the tag
+    holding the next section heading (or the end of the document); a table still
+    open at that tag is kept whole.
+    10-Ks are several MB; Item 2 is usually a small fraction of that.
+    """
+    m = _RAW_SECTION_RE.search(html)
+    if not m:
+        return None
+    # from the tag just before the heading text, so its element isn't left half-open
+    start = max(html.rfind(b"<", 0, m.start()), 0)
+    nxt = _RAW_NEXT_RE.search(html, m.end())
+    end = html.rfind(b"<", start, nxt.start() + 1) if nxt else -1
+    if end > start:
+        end = _close_open_tables(html, start, end)
+    return html[start:end] if end is not None and end > start else html[start:]
+
+# bytes kept between windows so a marker straddling a read boundary is still seen whole
+_SCAN_OVERLAP = 1024
+
+def _stream_item2_slice(fp: BinaryIO, window: int = 1 << 20) -> tuple[bytes | None, str]:
+    """
+    _locate_item2_slice over a binary file object, read `window` bytes at a time:
+    memory stays O(window + Item 2) instead of O(filing). Also returns the
+    encoding sniffed from the first window.
+    """
+    buf = fp.read(window)
+    encoding = _sniff_encoding(buf)
+    pos = 0
+    while True:
+        m = _RAW_SECTION_RE.search(buf, pos)
+        if m:
+            break
+        chunk = fp.read(window)
+        if not chunk:
+            return None, encoding
+        # pos=1 keeps the byte before the carried tail visible to the leading \b
+        buf = buf[-_SCAN_OVERLAP - 1:] + chunk
+        pos = 1
+
+    start = max(buf.rfind(b"<", 0, m.start()), 0)
+    out = bytearray(buf[start:])
+    pos = m.end() - start
+    while True:
+        nxt = _RAW_NEXT_RE.search(out, pos)
+        if nxt:
+            break
+        chunk = fp.read(window)
+        if not chunk:
+            return bytes(out), encoding
+        pos = max(len(out) - _SCAN_OVERLAP, pos)
+        out += chunk
+
+    end = out.rfind(b"<", 0, nxt.start() + 1)
+    if end <= 0:
+        return bytes(out), encoding
+    # as in _locate_item2_slice, a table open at the cut is kept whole: read on until it closes
+    cut = _close_open_tables(out, 0, end)
+    while cut is None:
+        chunk = fp.read(window)
+        if not chunk:
+            return bytes(out), encoding
+        out += chunk
+        cut = _close_open_tables(out, 0, end)
+    return bytes(out[:cut]), encoding
+
+def extract_item2_tables_html(html: str | bytes | BinaryIO) -> str | None:
     """
     Returns a concatenated HTML string of all <table> elements that appear
     after the 'Item 2 ... Properties' heading and before the next major section.
+    Accepts the decoded document, the raw downloaded bytes, or a seekable binary
+    file (e.g. edgar_scraper.open_10k), which is scanned in windows rather than read whole.
     Falls back to None if nothing is found.
     """
-    soup = _make_soup(html)
+    if hasattr(html, "read"):
+        item2, encoding = _stream_item2_slice(html)
+        if item2 is not None:
+            tables = _item2_tables_html(item2, encoding)
+            if tables:
+                return tables
+        html.seek(0)  # no usable slice: fall back to the whole document
+        return _item2_tables_html(html.read(), encoding)
 
-    # 1) find the heading text node (string) anywhere in the doc
-    heading_str = soup.find(string=lambda t: isinstance(t, str) and SECTION_RE.search(t))
-    if not heading_str:
-        return None
+    # slice the raw bytes (the markers are ASCII in every supported charset) so only the
+    # slice is ever transcoded; it loses the document's charset declaration, so sniff it up front
+    data, encoding = (html, _sniff_encoding(html)) if isinstance(html, bytes) else _as_bytes(html)
+    # parse only the Item 2 slice; the full document is the fallback
+    item2 = _locate_item2_slice(data)
+    if item2 is not None:
+        tables = _item2_tables_html(item2, encoding)
+        if tables:
+            return tables
+    return _item2_tables_html(data, encoding)
 
-    # 2) find the next section boundary (text) after heading
-    end_str = None
+def _item2_tables_html(html: str | bytes, encoding: str | None = None) -> str | None:
+    """
+    Stream the document once: start collecting <table>s after the 'Item 2 ...
+    Properties' text, stop at the next section's text. Finished elements are
+    dropped as we go, so memory stays bounded by the open branch and the
+    tables being collected rather than the whole 10-K.
+    """
+    tables = []       # serialized tables, in document (start-tag) order
+    open_tables = []  # [element, slot, texts seen before it, starts with end marker] for collected, unclosed tables
+    n_texts = 0       # non-blank text nodes seen so far
+    seen_heading = stopped = False
     try:
-        end_str = heading_str.find_next(string=lambda t: isinstance(t, str) and NEXT_RE.search(t))
-    except Exception:
-        end_str = None
-
-    # 3) walk forward from the heading, collecting tables until we hit the end_str
-    tables = []
-    cur = heading_str.parent  # start from the element containing the heading
-    seen_heading = False
-    while cur is not None:
-        # Mark that we've moved past the heading node
-        if cur is heading_str or getattr(cur, "string", None) is heading_str:
-            seen_heading = True
-
-        if seen_heading:
-            # stop at next section
-            if end_str is not None and (cur is end_str or getattr(cur, "string", None) is end_str):
-                break
-            if getattr(cur, "name", None) == "table":
-                tables.append(cur)
+        for event, elem in _iter_events(html, encoding):
+            # every text node sits right before some start/end tag: check it there, once
+            if event == "start":
+                prev = elem.getprevious()
+                parent = elem.getparent()
+                text = prev.tail if prev is not None else (parent.text if parent is not None else None)
+            else:
+                text = elem[-1].tail if len(elem) else elem.text
 
-        cur = cur.next_element
+            if text and not text.isspace():
+                if not seen_heading:
+                    # the heading needs a literal '2': a plain substring test rejects almost
+                    # every text node before the regex runs
+                    seen_heading = "2" in text and SECTION_RE.search(text) is not None
+                elif not stopped and NEXT_RE.search(text):
+                    stopped = True
+                    for t in open_tables:
+                        t[3] = t[2] == n_texts
+                n_texts += 1
 
-    if tables:
-        return "".join(str(t) for t in tables)
+            if event == "start":
+                if elem.tag == "table" and seen_heading and not stopped:
+                    open_tables.append([elem, len(tables), n_texts, False])
+                    tables.append(None)  # reserve its slot; serialized once complete
+                continue
 
-    # 4) Fallback: some filings don't put tables immediately after the heading.
-    #    As a fallback, return None here and let the caller scan the whole doc.
-    return None
+            if open_tables and open_tables[-1][0] is elem:
+                _, slot, start, starts_with_end = open_tables.pop()
+                # a table holding nothing but the next section's heading is layout around it
+                wraps_heading = starts_with_end and n_texts == start + 1
+                tables[slot] = "" if wraps_heading else etree.tostring(elem, method="html", encoding="unicode", with_tail=False)
+            if stopped and not open_tables:
+                break
+            if not open_tables:
+                # nothing below is needed any more (text before elem was checked)
+                elem.clear(keep_tail=True)
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+    except etree.XMLSyntaxError:
+        # empty / non-HTML input, or an error part-way: keep what was collected so far
+        for elem, slot, _, _ in open_tables:
+            tables[slot] = etree.tostring(elem, method="html", encoding="unicode", with_tail=False)
 
+    html_out = "".join(tables)
+    if html_out:
+        return html_out
+
+    # Fallback: some filings don't put tables immediately after the heading.
+    # Return None here and let the caller scan the whole doc.
+    return None
 
 
 def _norm(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").replace("\u00A0", " ")).strip()
+    # \s already covers \u00A0 for str patterns: one pass collapses both
+    return _WS_RE.sub(" ", s or "").strip()
+
+def _clean_address(s: str) -> str:
+    # s is already _norm'd (single spaces): without a '(' there is no footnote marker to
+    # drop and no gap to collapse, which is most cells, so skip both regex passes
+    if "(" not in s:
+        return s.strip()
+    return _MULTI_SPACE_RE.sub(" ", _PAREN_NUM_RE.sub("", s)).strip()
 
 def _find_col(colnames, *candidates):
     """Return the first column name that fuzzy-matches any candidate."""
@@ -84,70 +289,211 @@ def _find_col(colnames, *candidates):
                 return low[lc]
     return None
 
-def parse_property_addresses(item2_html: str, full_html_if_needed: str | None = None) -> list[dict]:
+@dataclass(frozen=True, slots=True)
+class PropertyRecord:
+    """One parsed property. p["address"] still works for code written against the old dicts."""
+    address: str
+
+    def __getitem__(self, key: str) -> str:
+        if key != "address":
+            raise KeyError(key)
+        return self.address
+
+
+# Parsed addresses per Item 2 HTML, keyed by a blake2b digest of the input rather
+# than the multi-KB/MB string itself; re-scoring a REIT skips the parse entirely.
+# Values are tuples of address strings / frozen PropertyRecords: immutable, safe to share.
+_ADDR_CACHE_MAX = 64
+_addr_cache: dict[tuple[str, bytes], tuple] = {}
+
+def _addr_key(kind: str, *parts: str | None) -> tuple[str, bytes]:
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update((part or "").encode("utf-8"))
+        h.update(b"\0")
+    return kind, h.digest()
+
+def parse_property_addresses(item2_html: str, full_html_if_needed: str | None = None) -> list[PropertyRecord]:
     """
-    Parse addresses from Item 2 tables using pandas.read_html, which handles
-    colspans/rowspans/spacer cells better than manual HTML walking.
+    Parse addresses from Item 2 tables with lxml, expanding colspans/rowspans
+    into a grid so spacer cells don't shift the columns.
     We look for a table containing both a 'Property'/'Properties' column and a 'Location' column.
-    Returns [{'address': 'Property Name, Location'}, ...]
+    Returns [PropertyRecord(address='Property Name, Location'), ...], first occurrence of each address only.
+
+    >>> [p.address for p in parse_property_addresses(
+    ...     "<table><tr><th>Property</th><th>Location</th></tr>"
+    ...     "<tr><td rowspan=3>One Penn</td><td>NY</td></tr><tr></tr>"
+    ...     "<tr><td>Boston</td></tr><tr><td>Two</td><td>Chicago</td></tr></table>")]
+    ['One Penn, NY', 'One Penn, Boston', 'Two, Chicago']
     """
-    def parse_html_with_pandas(html_fragment: str) -> list[dict]:
-        out = []
-        try:
-            dfs = pd.read_html(html_fragment, flavor="lxml")
-        except ValueError:
-            return out  # no tables
-        for df in dfs:
-            # flatten MultiIndex columns if present
-            if isinstance(df.columns, pd.MultiIndex):
-                df.columns = [" ".join([_norm(str(x)) for x in tup if x is not None]).strip() for tup in df.columns.values]
-            else:
-                df.columns = [_norm(str(c)) for c in df.columns]
+    def parse_tables(html_fragment: str) -> list[PropertyRecord]:
+        root = _parse_html(html_fragment) if html_fragment else None
+        if root is None:
+            return []
+        props = []
+        seen: set[str] = set()  # deduplicate as we go (interned keys): repeated rows never build a record
+        for table in root.iter("table"):
+            # one walk over the table's rows; a 'Location' column can only be named in a
+            # header row, so tables without it there are skipped before any body text is read
+            head, body = _table_rows(table)
+            if not any(_LOCATION_RE.search("".join(c.itertext())) for cells in head for c in cells):
+                continue
+            columns, body = _table_grid(head, body)
 
             # find key columns (case-insensitive, fuzzy)
-            prop_col = _find_col(df.columns, "property", "properties")
-            loc_col  = _find_col(df.columns, "location")
-
-            if not prop_col or not loc_col:
+            prop_col = _find_col(columns, "property", "properties")
+            loc_col  = _find_col(columns, "location")
+            if prop_col is None or loc_col is None:
                 continue
+            pi, li = columns.index(prop_col), columns.index(loc_col)
 
-            # clean rows (drop all-empty)
-            df = df[[prop_col, loc_col]].copy()
-            df[prop_col] = df[prop_col].astype(str).map(_norm)
-            df[loc_col]  = df[loc_col].astype(str).map(_norm)
-
-            # drop banner/section rows (e.g., 'Residential Communities', 'Office Building')
-            banners = set(["residential communities", "office building", "office buildings", "retail", "industrial"])
-            mask_banner = df[loc_col].str.len().eq(0) & df[prop_col].str.lower().isin(banners)
+            for row in body:
+                # text is built for these two cells only, not the whole row
+                prop = _cell_text(row[pi]) if pi < len(row) else ""
+                loc  = _cell_text(row[li]) if li < len(row) else ""
+                # keep rows with both fields non-empty (banner/section rows have no location)
+                if prop and loc:
+                    address = sys.intern(f"{prop}, {loc}")
+                    if address not in seen:
+                        seen.add(address)
+                        props.append(PropertyRecord(address))
+        return props
 
-            # keep rows with both fields non-empty
-            mask_valid = df[prop_col].ne("").astype(bool) & df[loc_col].ne("").astype(bool) & (~mask_banner)
-            for _, row in df[mask_valid].iterrows():
-                out.append({"address": f"{row[prop_col]}, {row[loc_col]}"})
-        return out
+    key = _addr_key("props", item2_html, full_html_if_needed)
+    hit = _addr_cache.get(key)
+    if hit is not None:
+        return list(hit)
 
-    props = parse_html_with_pandas(item2_html or "")
+    props = parse_tables(item2_html or "")
     if not props and full_html_if_needed:
-        props = parse_html_with_pandas(full_html_if_needed)
+        props = parse_tables(full_html_if_needed)
+    remember(_addr_cache, key, tuple(props), _ADDR_CACHE_MAX)
     return props
 
 
-def extract_addresses_from_table0_col0(cik: str) -> pd.DataFrame:
+def _span(cell, attr: str) -> int:
+    try:
+        return max(int(cell.get(attr, 1)), 1)
+    except ValueError:
+        return 1
+
+def _table_rows(table) -> tuple[list[list], list[list]]:
+    """
+    (header rows, body rows) of a table's own <td>/<th> cells. Header rows are
+    <thead> rows, else leading all-<th> rows (as read_html does). A <tr> without
+    cells is kept as an empty row: a rowspan above still covers it.
+    """
+    head, body = [], []
+    for tr in _TABLE_ROWS(table):
+        cells = [c for c in tr if c.tag in ("td", "th")]
+        (head if tr.getparent().tag == "thead" else body).append(cells)
+    if not head:
+        while body and all(c.tag == "th" for c in body[0]):
+            head.append(body.pop(0))
+    return head, body
+
+def _table_grid(head: list[list], body: list[list]) -> tuple[list[str], list[list]]:
+    """
+    (column names, body rows) with colspan/rowspan cells repeated into every
+    slot they cover; stacked headers are joined per column. Body rows hold the
+    cell elements (None for padding) so callers only build text for the columns they read.
+    """
+    grid = []
+    carry = {}  # column -> (rows still covered, cell) from a rowspan above
+    for i, cells in enumerate(head + body):
+        if i == len(head):
+            carry = {}  # as read_html: header rowspans don't reach into the body
+        row, below = [], {}
+        cells = iter(cells)
+        cell = next(cells, None)
+        while cell is not None or any(c >= len(row) for c in carry):
+            col = len(row)
+            if col in carry:
+                left, above = carry[col]
+                row.append(above)
+                if left > 1:
+                    below[col] = (left - 1, above)
+                continue
+            if cell is None:  # short row: pad up to the next rowspan column
+                row.append(None)
+                continue
+            rowspan = _span(cell, "rowspan")
+            for _ in range(_span(cell, "colspan")):
+                if rowspan > 1:
+                    below[len(row)] = (rowspan - 1, cell)
+                row.append(cell)
+            cell = next(cells, None)
+        grid.append(row)
+        carry = below
+
+    n_head = len(head)
+    header = [[_cell_text(c) for c in r] for r in grid[:n_head]]
+    width = max(map(len, header), default=0)
+    columns = [" ".join(r[i] for r in header if i < len(r) and r[i]) for i in range(width)]
+    return columns, grid[n_head:]
+
+def _cell_text(cell) -> str:
+    return _norm("".join(cell.itertext())) if cell is not None else ""
+
+
+def extract_addresses_from_table0_col0(cik: str) -> list[str]:
     """
     Download the latest 10-K for a CIK, parse Item 2 tables,
     and extract property addresses from Table 0, column 0.
-    Returns a DataFrame with a single 'address' column.
+    Returns a deduplicated list of address strings.
     """
-    html = download_10k_text(cik)
-    blk  = extract_item2_tables_html(html)
-    dfs  = pd.read_html(blk, flavor="lxml")
-    df0  = dfs[0]  # Table 0 is the properties table
+    with open_10k(cik) as fp:  # streamed from the filing cache: the whole 10-K is never held
+        item2_html = extract_item2_tables_html(fp)
+    return extract_addresses_from_item2_html(item2_html)
+
+
+def extract_addresses_from_item2_html(item2_html: str | None) -> list[str]:
+    """
+    Same as extract_addresses_from_table0_col0, for Item 2 tables HTML that
+    has already been extracted (see extract_item2_tables_html).
+    Only the first column of the first table is read; no DataFrames are built.
+    """
+    if not item2_html:
+        raise ValueError("No Item 2 property tables found in the 10-K.")
+    key = _addr_key("col0", item2_html)
+    hit = _addr_cache.get(key)
+    if hit is not None:
+        return list(hit)
+
+    table = _first_table(item2_html)
+    if table is None:
+        raise ValueError("No tables found")
 
-    s = df0.iloc[:, 0].astype(str).str.strip()
-    s = s[s.ne("")]
-    s = s[~s.str.fullmatch(r"(?i)property|properties")]
-    s = s[~s.str.contains(r"(?i)\bSEGMENT\b")]
-    s = s.str.replace(r"\(\d+\)", "", regex=True).str.replace(r"\s{2,}", " ", regex=True).str.strip()
+    # interned: the same address from another filing or a re-run shares one string object
+    addresses = list(dict.fromkeys(
+        sys.intern(_clean_address(c)) for c in _first_column(table) if c and not _SKIP_RE.search(c)
+    ))
+    remember(_addr_cache, key, tuple(addresses), _ADDR_CACHE_MAX)
+    return addresses
+
+
+def _first_table(html: str):
+    """
+    The first top-level <table> of a fragment. Item 2 is usually one main table
+    followed by others nobody reads here: parsing stops once it is complete.
+    """
+    depth = 0
+    try:
+        for event, elem in _iter_events(html):
+            if elem.tag != "table":
+                continue
+            if event == "start":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return elem
+    except etree.XMLSyntaxError:  # empty / non-HTML input
+        return None
+    return None
 
-    addresses = list(dict.fromkeys(s.tolist()))
-    return pd.DataFrame({"address": addresses})
\ No newline at end of file
+def _first_column(table) -> list[str]:
+    """Column-0 cell texts of the body rows, header rows excluded (as read_html does)."""
+    # the same grid parse_property_addresses reads: rowspans (also across empty rows) repeat down
+    _, body = _table_grid(*_table_rows(table))
+    return [_cell_text(row[0]) if row else "" for row in body]
@@ -2,14 +2,47 @@
 Combines the three factor scores using the weights from config.py to one ESG-Adjusted Distress score (0–100).
 '''
 
-from typing import Dict
+import numpy as np
+from typing import Optional, Tuple
 from .config import WEIGHTS
 
+# config weights as a (climate, carbon, gov) vector for matrix scoring
+WEIGHTS_VEC = np.array([WEIGHTS["climate"], WEIGHTS["carbon"], WEIGHTS["gov"]], dtype=np.float64)
+
+# scalar weights bound once: combine_scores does no dict lookups per call
+_WC, _WCA, _WG = WEIGHTS["climate"], WEIGHTS["carbon"], WEIGHTS["gov"]
+
 def combine_scores(climate_score: float, carbon_score: float, gov_score: float) -> float:
     """
     All inputs on 0–100 scale (higher = WORSE).
-    Output: 0–100 ESG-Adjusted Distress (higher = worse).
+    Output: 0–100 ESG-Adjusted Distress (higher = worse), unrounded;
+    round for display with format_score.
+    """
+    return _WC * climate_score + _WCA * carbon_score + _WG * gov_score
+
+def format_score(x: float) -> float:
+    """Presentation rounding (2 dp), applied once at the output boundary."""
+    return round(float(x), 2)
+
+def score_portfolio(sub_scores: np.ndarray, w: np.ndarray = WEIGHTS_VEC) -> np.ndarray:
+    """
+    sub_scores: (N, 3) array of [climate, carbon, gov] per REIT (or a single row of 3).
+    Returns the N final scores as one matrix-vector product, unrounded
+    (format_score rounds at the output boundary).
+    """
+    return np.asarray(sub_scores, dtype=float) @ w
+
+def combine_scores_vec(climate_score, carbon_score, gov_score, weights: Optional[Tuple[float, float, float]] = None) -> np.ndarray:
+    """
+    Array version of combine_scores: inputs may be scalars or arrays (one entry
+    per REIT or per horizon) and broadcast together.
+    `weights` is a (climate, carbon, gov) tuple; defaults to config.
     """
-    w = WEIGHTS
-    final = w["climate"]*climate_score + w["carbon"]*carbon_score + w["gov"]*gov_score
-    return round(final, 2)
+    w = WEIGHTS_VEC if weights is None else np.asarray(weights, dtype=np.float64)
+    # broadcast to (..., 3) rows of [climate, carbon, gov]: one dot product for every entry
+    rows = np.stack(np.broadcast_arrays(
+        np.asarray(climate_score, dtype=float),
+        np.asarray(carbon_score, dtype=float),
+        np.asarray(gov_score, dtype=float),
+    ), axis=-1)
+    return score_portfolio(rows, w)
@@ -1,12 +1,30 @@
-from casandra.demo_pipeline import score_reit
+import argparse, csv
+
+from casandra.demo_pipeline import ReitSpec, score_reits
 
 CARBON_CSV = "carbon_inputs.csv"
 
-res = score_reit(
-    cik="0000899689",
-    name="Vornado Realty Trust",
-    ticker="VNO",
-    carbon_csv=str(CARBON_CSV)
-)
+DEFAULT_REITS = [
+    ReitSpec(cik="0000899689", name="Vornado Realty Trust", ticker="VNO"),
+]
+
+
+def load_reits(path: str) -> list[ReitSpec]:
+    """REITs to score from a CSV with cik,name,ticker columns."""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        return [
+            ReitSpec(cik=row["cik"].strip(), name=row["name"].strip(), ticker=row["ticker"].strip())
+            for row in csv.DictReader(f)
+        ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score one or more REITs.")
+    parser.add_argument("reits_csv", nargs="?", help="CSV of cik,name,ticker rows (default: Vornado only)")
+    parser.add_argument("--carbon-csv", default=CARBON_CSV)
+    args = parser.parse_args()
 
-print(res)
+    reits = load_reits(args.reits_csv) if args.reits_csv else DEFAULT_REITS
+    # REITs run concurrently in threads, sharing the SEC/Nominatim rate limits and caches
+    for res in score_reits(reits, carbon_csv=args.carbon_csv):
+        print(res)